@@ -91,24 +91,23 @@ class AppManager:
         return None
 
     def load_manifest(self, app_manifest_path: str, app_dir_node: object):
+        self.register_apps(self.parse_manifest(app_manifest_path, app_dir_node))
+
+    def read_manifest(self, app_manifest_path: str):
+        # Returns raw App() declarations - they don't reference build nodes,
+        # so callers may cache them between runs. Doesn't touch manager
+        # state, so it's safe to call from worker threads
         if not os.path.exists(app_manifest_path):
             raise FlipperManifestException(
                 f"App manifest not found at path {app_manifest_path}"
             )
         # print("Loading", app_manifest_path)
 
-        app_manifests = []
+        app_declarations = []
 
         def App(*args, **kw):
-            nonlocal app_manifests
-            app_manifests.append(
-                FlipperApplication(
-                    *args,
-                    **kw,
-                    _appdir=app_dir_node,
-                    _apppath=os.path.dirname(app_manifest_path),
-                ),
-            )
+            nonlocal app_declarations
+            app_declarations.append((args, kw))
 
         def ExtFile(*args, **kw):
             return FlipperApplication.ExternallyBuiltFile(*args, **kw)
@@ -124,13 +123,40 @@ class AppManager:
                 f"Failed parsing manifest '{app_manifest_path}' : {e}"
             )
 
-        if len(app_manifests) == 0:
+        if len(app_declarations) == 0:
             raise FlipperManifestException(
                 f"App manifest '{app_manifest_path}' is malformed"
             )
 
-        # print("Built", app_manifests)
-        for app in app_manifests:
+        return app_declarations
+
+    def parse_manifest(
+        self,
+        app_manifest_path: str,
+        app_dir_node: object,
+        app_declarations: Optional[List[Tuple[tuple, dict]]] = None,
+    ):
+        # Binds declarations to app dir node - call from main thread only
+        if app_declarations is None:
+            app_declarations = self.read_manifest(app_manifest_path)
+
+        try:
+            return [
+                FlipperApplication(
+                    *args,
+                    **kw,
+                    _appdir=app_dir_node,
+                    _apppath=os.path.dirname(app_manifest_path),
+                )
+                for args, kw in app_declarations
+            ]
+        except Exception as e:
+            raise FlipperManifestException(
+                f"Failed parsing manifest '{app_manifest_path}' : {e}"
+            )
+
+    def register_apps(self, apps: List[FlipperApplication]):
+        for app in apps:
             self._add_known_app(app)
 
     def _add_known_app(self, app: FlipperApplication):
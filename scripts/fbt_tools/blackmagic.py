@@ -1,11 +1,21 @@
 from SCons.Errors import StopError
+from types import SimpleNamespace
+import glob
+import os
 
 
 class BlackmagicResolver:
     BLACKMAGIC_HOSTNAME = "blackmagic.local"
+    # udev names by-id links after USB manufacturer, product & serial, so
+    # same "blackmagic" token as in port scan is matched against link name.
+    # Interface 00 is the GDB server, 02 is UART
+    LINUX_GDB_PORT_GLOB = "/dev/serial/by-id/*-if00"
+    MACOS_PORT_GLOB = "/dev/cu.usbmodemblackmagic*"
 
     def __init__(self, env):
         self.env = env
+        self._probe_resolved = False
+        self._cached_probe = None
 
     # On Win:
     #    'location': '1-5:x.0', 'name': 'COM4',
@@ -16,10 +26,40 @@ class BlackmagicResolver:
     # On MacOS:
     #    'location': '0-1.3', 'name': 'cu.usbmodemblackmagic1',
     #    'location': '0-1.3', 'name': 'cu.usbmodemblackmagic3',
-    def _find_probe(self):
+    def _find_ports(self):
         import serial.tools.list_ports as list_ports
 
-        ports = list(list_ports.grep("blackmagic"))
+        # Plain substring match on the same fields list_ports.grep() checks,
+        # without compiling and running a regex per field per port
+        return [
+            p
+            for p in list_ports.comports()
+            if any(
+                "blackmagic" in (field or "").lower()
+                for field in (p.device, p.description, p.hwid)
+            )
+        ]
+
+    # Looks for device nodes directly, without going through pyserial.
+    # Only trusted when it's unambiguous, otherwise falls back to full scan
+    def _find_probe_fast(self):
+        platform = self.env.subst("$PLATFORM")
+        if platform == "posix":
+            paths = [
+                path
+                for path in glob.glob(self.LINUX_GDB_PORT_GLOB)
+                if "blackmagic" in os.path.basename(path).lower()
+            ]
+            if len(paths) == 1:
+                return SimpleNamespace(device=os.path.realpath(paths[0]))
+        elif platform == "darwin":
+            # Single probe exposes GDB & UART ports, GDB one sorts first
+            if len(paths := sorted(glob.glob(self.MACOS_PORT_GLOB))) == 2:
+                return SimpleNamespace(device=paths[0])
+        return None
+
+    def _find_probe_by_ports(self):
+        ports = self._find_ports()
         if len(ports) == 0:
             # Blackmagic probe serial port not found, will be handled later
             pass
@@ -30,6 +70,13 @@ class BlackmagicResolver:
             # print("\n".join([f"{p.device} {vars(p)}" for p in ports]))
             return sorted(ports, key=lambda p: f"{p.location}_{p.name}")[0]
 
+    def _find_probe(self):
+        # $BLACKMAGIC_ADDR can be substituted many times per run
+        if not self._probe_resolved:
+            self._cached_probe = self._find_probe_fast() or self._find_probe_by_ports()
+            self._probe_resolved = True
+        return self._cached_probe
+
     # Look up blackmagic probe hostname with dns
     def _resolve_hostname(self):
         import socket
@@ -2,7 +2,14 @@ from SCons.Builder import Builder
 from SCons.Action import Action
 from SCons.Warnings import warn, WarningOnByDefault
 from ansi.color import fg
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import hashlib
+import os
+import pickle
+import tempfile
 
+import fbt.appmanifest
 from fbt.appmanifest import (
     FlipperAppType,
     AppManager,
@@ -15,22 +22,193 @@ from fbt.appmanifest import (
 #  AppBuildset env["APPBUILD"] - contains subset of apps, filtered for current config
 
 
+APP_MANIFEST_NAME = "application.fam"
+
+
+def _find_app_manifest(entry):
+    manifest_glob = entry.glob(APP_MANIFEST_NAME)
+    if len(manifest_glob) == 0:
+        raise FlipperManifestException(
+            f"Folder {entry}: manifest {APP_MANIFEST_NAME} is missing"
+        )
+    return manifest_glob[0].rfile().abspath
+
+
 def LoadAppManifest(env, entry):
     try:
-        APP_MANIFEST_NAME = "application.fam"
-        manifest_glob = entry.glob(APP_MANIFEST_NAME)
-        if len(manifest_glob) == 0:
-            raise FlipperManifestException(
-                f"Folder {entry}: manifest {APP_MANIFEST_NAME} is missing"
-            )
-
-        app_manifest_file_path = manifest_glob[0].rfile().abspath
+        app_manifest_file_path = _find_app_manifest(entry)
         env["APPMGR"].load_manifest(app_manifest_file_path, entry)
         env.Append(PY_LINT_SOURCES=[app_manifest_file_path])
     except FlipperManifestException as e:
         warn(WarningOnByDefault, str(e))
 
 
+# Parsed manifest declarations, shared by all firmware envs and persisted
+# between runs. Maps manifest path -> (mtime_ns, size, pickled declarations)
+_manifest_cache = None
+_manifest_cache_dirty = False
+# Manifests seen in this run - entries for the rest are dropped on save
+_manifest_cache_used = set()
+
+
+def _get_manifest_cache_version():
+    # Declarations hold instances of appmanifest classes, and unpickling
+    # doesn't run their __init__ - so any change to manifest handling code
+    # must invalidate the whole cache
+    # blake2b is always available - md5 may be disabled on FIPS hosts
+    digest = hashlib.blake2b()
+    for source_path in (fbt.appmanifest.__file__, __file__):
+        with open(source_path, "rb") as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+def _save_manifest_cache(cache_path, cache_version):
+    stale_paths = _manifest_cache.keys() - _manifest_cache_used
+    if not (_manifest_cache_dirty or stale_paths):
+        return
+    for stale_path in stale_paths:
+        del _manifest_cache[stale_path]
+
+    # Written to a temp file and swapped in, so parallel or interrupted
+    # runs never leave a truncated cache behind
+    cache_dir = os.path.dirname(cache_path)
+    temp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_dir, prefix=".fam_cache.", delete=False
+        ) as cache_file:
+            temp_path = cache_file.name
+            pickle.dump(
+                {"version": cache_version, "manifests": _manifest_cache},
+                cache_file,
+            )
+        # NamedTemporaryFile creates it as 0600 - use regular file mode so
+        # the cache in shared build/ stays readable for other users
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        print(f"Failed to save manifest cache: {e}")
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _get_manifest_cache(env):
+    global _manifest_cache
+    if _manifest_cache is None:
+        cache_path = env.File("#build/.fam_cache.pkl").abspath
+        _manifest_cache = {}
+        try:
+            cache_version = _get_manifest_cache_version()
+        except Exception as e:
+            # Cache is only an optimization - run without it
+            print(f"Manifest cache disabled: {e}")
+            return _manifest_cache
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cache_contents = pickle.load(cache_file)
+            if cache_contents["version"] == cache_version:
+                _manifest_cache = cache_contents["manifests"]
+        except Exception:
+            pass
+        atexit.register(_save_manifest_cache, cache_path, cache_version)
+    return _manifest_cache
+
+
+def _get_cached_declarations(manifest_cache, app_manifest_file_path, cache_key):
+    cached = manifest_cache.get(app_manifest_file_path)
+    if not cached or cached[:2] != cache_key:
+        return None
+    try:
+        # Unpickled per lookup, so apps from different envs don't share lists
+        return pickle.loads(cached[2])
+    except Exception:
+        return None
+
+
+def _set_cached_declarations(
+    manifest_cache, app_manifest_file_path, cache_key, declarations
+):
+    global _manifest_cache_dirty
+    try:
+        manifest_cache[app_manifest_file_path] = (
+            *cache_key,
+            pickle.dumps(declarations),
+        )
+        _manifest_cache_dirty = True
+    except Exception:
+        # Manifest passes something unpicklable - just don't cache it
+        if manifest_cache.pop(app_manifest_file_path, None):
+            _manifest_cache_dirty = True
+
+
+def LoadApplicationManifests(env, app_dirs):
+    appmgr = env["APPMGR"]
+    manifest_cache = _get_manifest_cache(env)
+
+    # Plain scandir instead of Glob: no FS nodes are created for entries
+    # that aren't app folders. Sorted to keep Glob's ordering
+    app_entries = []
+    for app_dir, _ in app_dirs:
+        app_dir_node = env.Dir("#").Dir(app_dir)
+
+        try:
+            with os.scandir(app_dir_node.srcnode().abspath) as dir_entries:
+                app_entries.extend(
+                    (app_dir_node.Dir(dir_entry.name), dir_entry.path)
+                    for dir_entry in sorted(dir_entries, key=lambda e: e.name)
+                    if dir_entry.is_dir() and not dir_entry.name.startswith(".")
+                )
+        except FileNotFoundError:
+            pass
+
+    # Changed manifests are read in parallel, but apps are registered
+    # serially and in discovery order - AppManager is not thread-safe
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pending = []
+        for entry, entry_path in app_entries:
+            try:
+                app_manifest_file_path = os.path.join(entry_path, APP_MANIFEST_NAME)
+                try:
+                    manifest_stat = os.stat(app_manifest_file_path)
+                except FileNotFoundError:
+                    raise FlipperManifestException(
+                        f"Folder {entry}: manifest {APP_MANIFEST_NAME} is missing"
+                    )
+                cache_key = (manifest_stat.st_mtime_ns, manifest_stat.st_size)
+                _manifest_cache_used.add(app_manifest_file_path)
+                declarations = _get_cached_declarations(
+                    manifest_cache, app_manifest_file_path, cache_key
+                )
+                if declarations is None:
+                    declarations = executor.submit(
+                        appmgr.read_manifest, app_manifest_file_path
+                    )
+                pending.append((entry, app_manifest_file_path, cache_key, declarations))
+            except (FlipperManifestException, OSError) as e:
+                warn(WarningOnByDefault, str(e))
+
+        for entry, app_manifest_file_path, cache_key, declarations in pending:
+            try:
+                if not isinstance(declarations, list):
+                    declarations = declarations.result()
+                    _set_cached_declarations(
+                        manifest_cache, app_manifest_file_path, cache_key, declarations
+                    )
+                appmgr.register_apps(
+                    appmgr.parse_manifest(app_manifest_file_path, entry, declarations)
+                )
+                env.Append(PY_LINT_SOURCES=[app_manifest_file_path])
+            except FlipperManifestException as e:
+                warn(WarningOnByDefault, str(e))
+
+
 def PrepareApplicationsBuild(env):
     appbuild = env["APPBUILD"] = env["APPMGR"].filter_apps(
         env["APPS"], env.subst("f${TARGET_HW}")
@@ -43,9 +221,14 @@ def PrepareApplicationsBuild(env):
 def DumpApplicationConfig(target, source, env):
     print(f"Loaded {len(env['APPMGR'].known_apps)} app definitions.")
     print(fg.boldgreen("Firmware modules configuration:"))
-    for apptype in FlipperAppType:
-        app_sublist = env["APPBUILD"].get_apps_of_type(apptype)
+    # Single pass over the buildset instead of a full scan per app type
+    apps_by_type = {apptype: [] for apptype in FlipperAppType}
+    for app in env["APPBUILD"].apps:
+        apps_by_type[app.apptype].append(app)
+
+    for apptype, app_sublist in apps_by_type.items():
         if app_sublist:
+            app_sublist.sort(key=lambda app: app.order)
             print(
                 fg.green(f"{apptype.value}:\n\t"),
                 ", ".join(app.appid for app in app_sublist),
@@ -56,12 +239,17 @@ def build_apps_c(target, source, env):
     target_file_name = target[0].path
 
     gen = ApplicationsCGenerator(env["APPBUILD"], env.subst("$LOADER_AUTOSTART"))
-    with open(target_file_name, "w") as file:
-        file.write(gen.generate())
+    # Encoded up front so the whole file goes out in a single write.
+    # Binary mode also means output is always UTF-8 with LF line endings,
+    # regardless of host platform or locale
+    contents = gen.generate().encode("utf-8")
+    with open(target_file_name, "wb") as file:
+        file.write(contents)
 
 
 def generate(env):
     env.AddMethod(LoadAppManifest)
+    env.AddMethod(LoadApplicationManifests)
     env.AddMethod(PrepareApplicationsBuild)
     env.SetDefault(
         APPMGR=AppManager(),